@@ -0,0 +1,26 @@
+"""Entry point for ``telegram-notifier`` and ``python -m telegram_notifier``."""
+
+from __future__ import annotations
+
+import sys
+
+from . import __version__
+
+
+def main() -> None:
+    """Entry point for the CLI application.
+
+    ``--version`` is answered here without importing click; every other
+    invocation is handed to the click group.
+    """
+    if sys.argv[1:] == ["--version"]:
+        print(f"telegram-notifier, version {__version__}")
+        return
+
+    from .cli import cli
+
+    cli(prog_name="telegram-notifier")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""Subcommands for the Telegram Notifier CLI, loaded on demand by ``cli``."""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+from typing import Callable
+
+import click
+
+
+def _resolve_token(token: str | None) -> str:
+    """Resolve the bot token from the option or the TELEGRAM_BOT_TOKEN variable.
+
+    Args:
+        token: Bot token given on the command line, if any
+
+    Returns:
+        The bot token
+
+    Raises:
+        click.ClickException: If no token is available
+    """
+    bot_token = token or os.getenv("TELEGRAM_BOT_TOKEN")
+    if not bot_token:
+        raise click.ClickException(
+            "Bot token is required. Use --token or set TELEGRAM_BOT_TOKEN"
+        )
+    return bot_token
+
+
+def _resolve_chat_id(chat_id: str | None) -> str:
+    """Resolve the chat ID from the option or the TELEGRAM_CHAT_ID variable.
+
+    Args:
+        chat_id: Chat ID given on the command line, if any
+
+    Returns:
+        The target chat ID
+
+    Raises:
+        click.ClickException: If no chat ID is available
+    """
+    target_chat_id = chat_id or os.getenv("TELEGRAM_CHAT_ID")
+    if not target_chat_id:
+        raise click.ClickException(
+            "Chat ID is required. Use --chat-id or set TELEGRAM_CHAT_ID"
+        )
+    return target_chat_id
+
+
+def _read_jobs(path: str) -> list[tuple[str, str]]:
+    """Read (chat_id, message) pairs from a tab-separated file.
+
+    Each non-blank line holds a chat ID and the message text, separated by
+    the first tab on the line.
+
+    Args:
+        path: Path to the file to read
+
+    Returns:
+        The (chat_id, message) pairs in file order
+
+    Raises:
+        click.ClickException: If a line is malformed or not valid UTF-8, or the
+            file has no messages
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        lineno = data.count(b"\n", 0, e.start) + 1
+        raise click.ClickException(f"{path}:{lineno}: not valid UTF-8")
+
+    jobs = []
+    # newline=None splits lines the way open() does in text mode
+    for lineno, line in enumerate(io.StringIO(text, newline=None), start=1):
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            continue
+        chat_id, tab, message = line.partition("\t")
+        if not tab or not chat_id:
+            raise click.ClickException(
+                f"{path}:{lineno}: expected 'chat_id<TAB>message'"
+            )
+        jobs.append((chat_id, message))
+
+    if not jobs:
+        raise click.ClickException(f"No messages found in {path}")
+    return jobs
+
+
+def _invoke(
+    action: Callable[[], bool | None], success_msg: str, fail_msg: str | None = None
+) -> None:
+    """Run a send action and report the outcome, exiting with status 1 on failure.
+
+    Telegram, file and OS-level errors are reported as messages; anything
+    else is a bug and propagates so click shows the traceback.
+
+    Args:
+        action: Callable performing the send; returning False marks a failed
+            send, while actions that only fail by raising return None
+        success_msg: Message echoed when the send succeeds
+        fail_msg: Message echoed to stderr when the action returns False
+    """
+    from telegram.error import TelegramError
+
+    try:
+        success = action()
+    except FileNotFoundError as e:
+        click.echo(f"File error: {e}", err=True)
+        sys.exit(1)
+    except TelegramError as e:
+        click.echo(f"Telegram API error: {e}", err=True)
+        sys.exit(1)
+    except (OSError, ValueError) as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        sys.exit(1)
+
+    if success is False:
+        click.echo(fail_msg, err=True)
+        sys.exit(1)
+    click.echo(success_msg)
+
+
+def _send_via_daemon(chat_id: str, message: str, token: str | None) -> bool:
+    """Send a message through the daemon if one is listening.
+
+    Args:
+        chat_id: The target chat ID
+        message: The message text to send
+        token: Bot token given on the command line, if any; it or
+            TELEGRAM_BOT_TOKEN must match the daemon's bot
+
+    Returns:
+        True if the daemon sent the message, False if no daemon is running
+
+    Raises:
+        click.ClickException: If the daemon is running but the send failed
+    """
+    from .daemon import DaemonError, send_via_daemon
+
+    try:
+        send_via_daemon(
+            chat_id, message, bot_token=token or os.getenv("TELEGRAM_BOT_TOKEN")
+        )
+    except (FileNotFoundError, ConnectionRefusedError):
+        return False
+    except (DaemonError, OSError) as e:
+        raise click.ClickException(f"Daemon error: {e}")
+    return True
+
+
+@click.command("send")
+@click.option(
+    "--token",
+    help="Telegram bot token (or set TELEGRAM_BOT_TOKEN env var)",
+    type=str,
+)
+@click.option(
+    "--chat-id",
+    help="Target chat ID (or set TELEGRAM_CHAT_ID env var)",
+    type=str,
+)
+@click.option(
+    "--message",
+    help="Message text to send",
+    type=str,
+)
+@click.option(
+    "--file-of-messages",
+    help="Tab-separated file of 'chat_id<TAB>message' lines to send",
+    type=click.Path(exists=True, dir_okay=False),
+)
+@click.option(
+    "--via-daemon",
+    is_flag=True,
+    help="Send through a running 'daemon', falling back to a direct send",
+)
+def send(
+    token: str | None,
+    chat_id: str | None,
+    message: str | None,
+    file_of_messages: str | None,
+    via_daemon: bool,
+) -> None:
+    """Send a message to a Telegram chat.
+
+    With --file-of-messages, every line of the file is sent to the chat ID it
+    names, within Telegram's rate limit, and --chat-id is not used.
+    """
+    if message is not None and file_of_messages is not None:
+        raise click.UsageError(
+            "Options '--message' and '--file-of-messages' are mutually exclusive."
+        )
+    if via_daemon and file_of_messages is not None:
+        raise click.UsageError(
+            "Option '--via-daemon' cannot be used with '--file-of-messages'."
+        )
+
+    if file_of_messages is not None:
+        if chat_id is not None:
+            raise click.UsageError(
+                "Option '--chat-id' cannot be used with '--file-of-messages'."
+            )
+        bot_token = _resolve_token(token)
+        jobs = _read_jobs(file_of_messages)
+
+        from .notifier import send_many
+
+        _invoke(
+            lambda: send_many(bot_token, jobs),
+            f"{len(jobs)} messages sent successfully!",
+        )
+        return
+
+    if message is None:
+        raise click.UsageError("Missing option '--message' or '--file-of-messages'.")
+
+    if via_daemon and _send_via_daemon(_resolve_chat_id(chat_id), message, token):
+        click.echo("Message sent successfully!")
+        return
+
+    bot_token = _resolve_token(token)
+    target_chat_id = _resolve_chat_id(chat_id)
+
+    # Imported here so --help and argument errors don't pay for the telegram stack
+    from .notifier import send_notification
+
+    _invoke(
+        lambda: send_notification(bot_token, target_chat_id, message),
+        "Message sent successfully!",
+        "Failed to send message",
+    )
+
+
+@click.command("send-file-cmd")
+@click.option(
+    "--token",
+    help="Telegram bot token (or set TELEGRAM_BOT_TOKEN env var)",
+    type=str,
+)
+@click.option(
+    "--chat-id",
+    help="Target chat ID (or set TELEGRAM_CHAT_ID env var)",
+    type=str,
+)
+@click.option(
+    "--file",
+    required=True,
+    help="Path to the file to send",
+    type=click.Path(exists=True),
+)
+@click.option(
+    "--caption",
+    help="Optional caption for the file",
+    type=str,
+)
+def send_file_cmd(
+    token: str | None, chat_id: str | None, file: str, caption: str | None
+) -> None:
+    """Send a file to a Telegram chat."""
+    bot_token = _resolve_token(token)
+    target_chat_id = _resolve_chat_id(chat_id)
+
+    from .notifier import send_file
+
+    _invoke(
+        lambda: send_file(bot_token, target_chat_id, file, caption),
+        f"File '{file}' sent successfully!",
+        "Failed to send file",
+    )
+
+
+@click.command("send-photo-cmd")
+@click.option(
+    "--token",
+    help="Telegram bot token (or set TELEGRAM_BOT_TOKEN env var)",
+    type=str,
+)
+@click.option(
+    "--chat-id",
+    help="Target chat ID (or set TELEGRAM_CHAT_ID env var)",
+    type=str,
+)
+@click.option(
+    "--file",
+    required=True,
+    help="Path to the image file to send",
+    type=click.Path(exists=True),
+)
+@click.option(
+    "--caption",
+    help="Optional caption for the photo",
+    type=str,
+)
+def send_photo_cmd(
+    token: str | None, chat_id: str | None, file: str, caption: str | None
+) -> None:
+    """Send a photo to a Telegram chat."""
+    bot_token = _resolve_token(token)
+    target_chat_id = _resolve_chat_id(chat_id)
+
+    from .notifier import send_photo
+
+    _invoke(
+        lambda: send_photo(bot_token, target_chat_id, file, caption),
+        f"Photo '{file}' sent successfully!",
+        "Failed to send photo",
+    )
+
+
+@click.command("daemon")
+@click.option(
+    "--token",
+    help="Telegram bot token (or set TELEGRAM_BOT_TOKEN env var)",
+    type=str,
+)
+def daemon_cmd(token: str | None) -> None:
+    """Keep a bot running in the background for 'send --via-daemon'.
+
+    Listens on $TELEGRAM_NOTIFIER_SOCKET, or telegram-notifier.sock in
+    $XDG_RUNTIME_DIR, or a per-user socket in the temp directory when neither
+    is set. Anyone who can open the socket can send as the bot, so it is only
+    accessible to the current user, and 'send' refuses a socket that is not.
+    """
+    bot_token = _resolve_token(token)
+
+    from telegram.error import TelegramError
+
+    from . import daemon
+
+    path = daemon.default_socket_path()
+    click.echo(f"Listening on {path}")
+    try:
+        daemon.run(bot_token, path)
+    except KeyboardInterrupt:
+        pass
+    except (TelegramError, RuntimeError) as e:
+        raise click.ClickException(str(e))
@@ -1,201 +1,63 @@
 """Command-line interface for Telegram Notifier."""
 
-import os
-import sys
-from typing import Optional
+from __future__ import annotations
 
-import click
-from telegram.error import TelegramError
-
-from .notifier import send_notification, send_file, send_photo
+import importlib
+from typing import Any
 
+import click
 
-@click.group()
-@click.version_option()
+from . import __version__
+
+# The entry point moved to __main__; keep `telegram_notifier.cli:main` importable
+from .__main__ import main  # noqa: F401
+
+
+class LazyGroup(click.Group):
+    """Click group that imports its subcommands only when they are looked up."""
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the group.
+
+        Args:
+            lazy_subcommands: Mapping of command name to "module:attribute"
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return eager and lazy command names without importing the latter."""
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return the named command, importing it first if it is lazy."""
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attr_name = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attr_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy command '{cmd_name}' is not a click.Command")
+        return command
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "daemon": "telegram_notifier._cmds:daemon_cmd",
+        "send": "telegram_notifier._cmds:send",
+        "send-file-cmd": "telegram_notifier._cmds:send_file_cmd",
+        "send-photo-cmd": "telegram_notifier._cmds:send_photo_cmd",
+    },
+)
+@click.version_option(__version__)
 def cli() -> None:
     """Telegram Notifier - Send messages to Telegram chats from the command line."""
     pass
-
-
-@cli.command()
-@click.option(
-    "--token",
-    help="Telegram bot token (or set TELEGRAM_BOT_TOKEN env var)",
-    type=str,
-)
-@click.option(
-    "--chat-id",
-    help="Target chat ID (or set TELEGRAM_CHAT_ID env var)",
-    type=str,
-)
-@click.option(
-    "--message",
-    required=True,
-    help="Message text to send",
-    type=str,
-)
-def send(token: Optional[str], chat_id: Optional[str], message: str) -> None:
-    """Send a message to a Telegram chat."""
-    # Get credentials from environment if not provided
-    bot_token = token or os.getenv("TELEGRAM_BOT_TOKEN")
-    target_chat_id = chat_id or os.getenv("TELEGRAM_CHAT_ID")
-
-    # Validate required parameters
-    if not bot_token:
-        click.echo(
-            "Error: Bot token is required. Use --token or set TELEGRAM_BOT_TOKEN",
-            err=True,
-        )
-        sys.exit(1)
-
-    if not target_chat_id:
-        click.echo(
-            "Error: Chat ID is required. Use --chat-id or set TELEGRAM_CHAT_ID",
-            err=True,
-        )
-        sys.exit(1)
-
-    try:
-        success = send_notification(bot_token, target_chat_id, message)
-        if success:
-            click.echo("Message sent successfully!")
-        else:
-            click.echo("Failed to send message", err=True)
-            sys.exit(1)
-    except TelegramError as e:
-        click.echo(f"Telegram API error: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"Unexpected error: {e}", err=True)
-        sys.exit(1)
-
-
-@cli.command()
-@click.option(
-    "--token",
-    help="Telegram bot token (or set TELEGRAM_BOT_TOKEN env var)",
-    type=str,
-)
-@click.option(
-    "--chat-id",
-    help="Target chat ID (or set TELEGRAM_CHAT_ID env var)",
-    type=str,
-)
-@click.option(
-    "--file",
-    required=True,
-    help="Path to the file to send",
-    type=click.Path(exists=True),
-)
-@click.option(
-    "--caption",
-    help="Optional caption for the file",
-    type=str,
-)
-def send_file_cmd(
-    token: Optional[str], chat_id: Optional[str], file: str, caption: Optional[str]
-) -> None:
-    """Send a file to a Telegram chat."""
-    # Get credentials from environment if not provided
-    bot_token = token or os.getenv("TELEGRAM_BOT_TOKEN")
-    target_chat_id = chat_id or os.getenv("TELEGRAM_CHAT_ID")
-
-    # Validate required parameters
-    if not bot_token:
-        click.echo(
-            "Error: Bot token is required. Use --token or set TELEGRAM_BOT_TOKEN",
-            err=True,
-        )
-        sys.exit(1)
-
-    if not target_chat_id:
-        click.echo(
-            "Error: Chat ID is required. Use --chat-id or set TELEGRAM_CHAT_ID",
-            err=True,
-        )
-        sys.exit(1)
-
-    try:
-        success = send_file(bot_token, target_chat_id, file, caption)
-        if success:
-            click.echo(f"File '{file}' sent successfully!")
-        else:
-            click.echo("Failed to send file", err=True)
-            sys.exit(1)
-    except FileNotFoundError as e:
-        click.echo(f"File error: {e}", err=True)
-        sys.exit(1)
-    except TelegramError as e:
-        click.echo(f"Telegram API error: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"Unexpected error: {e}", err=True)
-        sys.exit(1)
-
-
-@cli.command()
-@click.option(
-    "--token",
-    help="Telegram bot token (or set TELEGRAM_BOT_TOKEN env var)",
-    type=str,
-)
-@click.option(
-    "--chat-id",
-    help="Target chat ID (or set TELEGRAM_CHAT_ID env var)",
-    type=str,
-)
-@click.option(
-    "--file",
-    required=True,
-    help="Path to the image file to send",
-    type=click.Path(exists=True),
-)
-@click.option(
-    "--caption",
-    help="Optional caption for the photo",
-    type=str,
-)
-def send_photo_cmd(
-    token: Optional[str], chat_id: Optional[str], file: str, caption: Optional[str]
-) -> None:
-    """Send a photo to a Telegram chat."""
-    # Get credentials from environment if not provided
-    bot_token = token or os.getenv("TELEGRAM_BOT_TOKEN")
-    target_chat_id = chat_id or os.getenv("TELEGRAM_CHAT_ID")
-
-    # Validate required parameters
-    if not bot_token:
-        click.echo(
-            "Error: Bot token is required. Use --token or set TELEGRAM_BOT_TOKEN",
-            err=True,
-        )
-        sys.exit(1)
-
-    if not target_chat_id:
-        click.echo(
-            "Error: Chat ID is required. Use --chat-id or set TELEGRAM_CHAT_ID",
-            err=True,
-        )
-        sys.exit(1)
-
-    try:
-        success = send_photo(bot_token, target_chat_id, file, caption)
-        if success:
-            click.echo(f"Photo '{file}' sent successfully!")
-        else:
-            click.echo("Failed to send photo", err=True)
-            sys.exit(1)
-    except FileNotFoundError as e:
-        click.echo(f"File error: {e}", err=True)
-        sys.exit(1)
-    except TelegramError as e:
-        click.echo(f"Telegram API error: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"Unexpected error: {e}", err=True)
-        sys.exit(1)
-
-
-def main() -> None:
-    """Entry point for the CLI application."""
-    cli()
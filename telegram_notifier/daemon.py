@@ -0,0 +1,201 @@
+"""Background daemon that keeps a warm bot for repeated command-line sends.
+
+The daemon listens on a UNIX socket and reads one JSON object per line,
+``{"chat_id": ..., "text": ...}``, answering each with ``{"ok": true}`` or
+``{"ok": false, "error": ...}``. A request may also carry the client's bot
+``"token"``, which is then refused unless it is the daemon's own. Anyone who
+can connect to the socket can send messages as the bot, so it is created
+readable and writable by its owner only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import json
+import os
+import socket
+import stat
+import tempfile
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .notifier import TelegramNotifier
+
+
+class DaemonError(Exception):
+    """Raised when the daemon reports that a message could not be sent."""
+
+
+def default_socket_path() -> str:
+    """Return the socket path shared by the daemon and its clients.
+
+    Uses TELEGRAM_NOTIFIER_SOCKET if set, otherwise a socket in
+    XDG_RUNTIME_DIR, falling back to a per-user name in the temp directory.
+    """
+    path = os.getenv("TELEGRAM_NOTIFIER_SOCKET")
+    if path:
+        return path
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "telegram-notifier.sock")
+    return os.path.join(tempfile.gettempdir(), f"telegram-notifier-{os.getuid()}.sock")
+
+
+def _check_socket_owner(path: str) -> None:
+    """Refuse a socket that another user could have planted or can reach.
+
+    The temp directory fallback is a predictable, shared location, so a
+    listener there must not be trusted with message text until its socket is
+    known to belong to us and to be closed to everyone else.
+    """
+    st = os.stat(path)
+    if st.st_uid != os.getuid():
+        raise DaemonError(f"Refusing {path}: not owned by the current user")
+    if stat.S_IMODE(st.st_mode) & 0o077:
+        raise DaemonError(f"Refusing {path}: accessible to other users")
+
+
+def send_via_daemon(
+    chat_id: str,
+    message: str,
+    path: str | None = None,
+    timeout: float = 30.0,
+    bot_token: str | None = None,
+) -> None:
+    """Send a message through a running daemon.
+
+    Args:
+        chat_id: The target chat ID
+        message: The message text to send
+        path: Socket path, defaulting to default_socket_path()
+        timeout: Seconds to wait for the daemon to answer
+        bot_token: Bot token the client expects the daemon to send as, if any
+
+    Raises:
+        FileNotFoundError: If no daemon socket exists
+        ConnectionRefusedError: If the socket exists but nothing is listening
+        DaemonError: If the socket is not private to the current user, the
+            daemon runs a different bot, or it could not send the message
+    """
+    path = path or default_socket_path()
+    _check_socket_owner(path)
+    payload = {"chat_id": chat_id, "text": message}
+    if bot_token:
+        payload["token"] = bot_token
+    request = json.dumps(payload).encode() + b"\n"
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(request)
+        with sock.makefile("rb") as reader:
+            reply_line = reader.readline()
+
+    if not reply_line:
+        raise DaemonError("Daemon closed the connection without replying")
+    try:
+        reply = json.loads(reply_line)
+    except ValueError as e:
+        raise DaemonError(f"Malformed reply from daemon: {e}") from e
+    if not isinstance(reply, dict):
+        raise DaemonError(f"Malformed reply from daemon: {reply!r}")
+    if not reply.get("ok"):
+        raise DaemonError(reply.get("error") or "Failed to send message")
+
+
+async def _process(notifier: TelegramNotifier, line: bytes) -> dict[str, Any]:
+    from telegram.error import TelegramError
+
+    try:
+        request = json.loads(line)
+        chat_id, text = str(request["chat_id"]), str(request["text"])
+        token = request.get("token")
+    except (ValueError, KeyError, TypeError) as e:
+        return {"ok": False, "error": f"Bad request: {e}"}
+
+    if token is not None and not hmac.compare_digest(
+        str(token).encode(), notifier.bot.token.encode()
+    ):
+        return {"ok": False, "error": "Bot token does not match the daemon's bot"}
+
+    try:
+        sent = await notifier.send_message(chat_id, text)
+    except TelegramError as e:
+        return {"ok": False, "error": str(e)}
+    if not sent:
+        return {"ok": False, "error": "Failed to send message"}
+    return {"ok": True}
+
+
+def _claim_socket_path(path: str) -> None:
+    """Remove a stale socket left by a dead daemon, refusing to displace a live one."""
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            os.unlink(path)
+            return
+    raise RuntimeError(f"A daemon is already listening on {path}")
+
+
+async def serve(notifier: TelegramNotifier, path: str) -> None:
+    """Serve send requests on a UNIX socket until cancelled.
+
+    Args:
+        notifier: The notifier used to send every request
+        path: Socket path to listen on; removed again on shutdown
+
+    Raises:
+        RuntimeError: If another daemon is already listening on the path
+    """
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                reply = await _process(notifier, line)
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    _claim_socket_path(path)
+    old_umask = os.umask(0o177)
+    try:
+        server = await asyncio.start_unix_server(handle, path=path)
+    finally:
+        os.umask(old_umask)
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def run(bot_token: str, path: str) -> None:
+    """Run the daemon in the foreground until interrupted.
+
+    Args:
+        bot_token: The Telegram bot token
+        path: Socket path to listen on
+
+    Raises:
+        TelegramError: If the bot token is rejected at startup
+        RuntimeError: If another daemon is already listening on the path
+    """
+    from .notifier import TelegramNotifier
+
+    async def main() -> None:
+        async with TelegramNotifier(bot_token) as notifier:
+            await serve(notifier, path)
+
+    asyncio.run(main())
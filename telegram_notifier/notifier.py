@@ -1,12 +1,39 @@
 """Core Telegram notification functionality."""
 
+from __future__ import annotations
+
 import asyncio
-import os
+import atexit
+import threading
 from pathlib import Path
-from typing import Optional
+from types import TracebackType
+from typing import Any, Coroutine, Iterable, TypeVar
+
+_T = TypeVar("_T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_notifiers: dict[str, TelegramNotifier] = {}
+# Guards _loop and _notifiers; one loop cannot run in two threads at once
+_lock = threading.Lock()
+
+
+async def _read_upload(file_path: str) -> tuple[bytes, str]:
+    """Read a file to upload, returning its contents and file name.
+
+    The read runs in the default executor so disk I/O doesn't block the loop;
+    python-telegram-bot loads the whole upload into memory before posting it,
+    so reading it up front costs nothing extra.
 
-from telegram import Bot
-from telegram.error import TelegramError
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    path = Path(file_path)
+    loop = asyncio.get_running_loop()
+    try:
+        content = await loop.run_in_executor(None, path.read_bytes)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {file_path}") from e
+    return content, path.name
 
 
 class TelegramNotifier:
@@ -18,7 +45,39 @@ class TelegramNotifier:
         Args:
             bot_token: The Telegram bot token from BotFather
         """
-        self.bot = Bot(token=bot_token)
+        # Deferred so importing the package doesn't load python-telegram-bot
+        from telegram import Bot
+        from telegram.request import HTTPXRequest
+
+        # HTTP/2 multiplexes concurrent sends over one connection; the pool
+        # leaves room for send_many's default rate
+        self.bot = Bot(
+            token=bot_token,
+            request=HTTPXRequest(http_version="2", connection_pool_size=32),
+        )
+
+    async def __aenter__(self) -> TelegramNotifier:
+        """Initialize the underlying bot for use as an async context manager."""
+        await self.bot.initialize()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Shut down the underlying bot and close its HTTP connections."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP connections opened by this notifier.
+
+        Bot.shutdown() does nothing for a bot that was never initialized, so
+        the send request is shut down directly as well.
+        """
+        await self.bot.shutdown()
+        await self.bot.request.shutdown()
 
     async def send_message(self, chat_id: str, message: str) -> bool:
         """Send a message to a Telegram chat.
@@ -33,14 +92,51 @@ class TelegramNotifier:
         Raises:
             TelegramError: If there's an issue with the Telegram API
         """
+        from telegram.error import TelegramError
+
         try:
             await self.bot.send_message(chat_id=chat_id, text=message)
             return True
         except TelegramError as e:
             raise TelegramError(f"Failed to send message: {e}")
 
+    async def send_many(self, jobs: Iterable[tuple[str, str]], rate: int = 28) -> None:
+        """Send several messages concurrently without exceeding a rate limit.
+
+        Telegram allows a bot roughly 30 messages per second. Each send takes a
+        slot that is only released one second after it started, so at most
+        ``rate`` messages go out in any one-second window.
+
+        If one message fails, the sends still waiting or in flight are
+        cancelled before the error is raised, so nothing more goes out once
+        the caller has seen the failure.
+
+        Args:
+            jobs: (chat_id, message) pairs to send
+            rate: Maximum number of messages to send per second
+
+        Raises:
+            TelegramError: If any message fails to send
+        """
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(rate)
+
+        async def send_one(chat_id: str, message: str) -> None:
+            await slots.acquire()
+            loop.call_later(1.0, slots.release)
+            await self.send_message(chat_id, message)
+
+        tasks = [asyncio.ensure_future(send_one(chat_id, msg)) for chat_id, msg in jobs]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def send_document(
-        self, chat_id: str, file_path: str, caption: Optional[str] = None
+        self, chat_id: str, file_path: str, caption: str | None = None
     ) -> bool:
         """Send a document file to a Telegram chat.
 
@@ -56,23 +152,23 @@ class TelegramNotifier:
             TelegramError: If there's an issue with the Telegram API
             FileNotFoundError: If the file doesn't exist
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+        content, filename = await _read_upload(file_path)
+
+        from telegram.error import TelegramError
 
         try:
-            with open(file_path, "rb") as file:
-                await self.bot.send_document(
-                    chat_id=chat_id,
-                    document=file,
-                    caption=caption,
-                    filename=Path(file_path).name,
-                )
+            await self.bot.send_document(
+                chat_id=chat_id,
+                document=content,
+                caption=caption,
+                filename=filename,
+            )
             return True
         except TelegramError as e:
             raise TelegramError(f"Failed to send document: {e}")
 
     async def send_photo(
-        self, chat_id: str, file_path: str, caption: Optional[str] = None
+        self, chat_id: str, file_path: str, caption: str | None = None
     ) -> bool:
         """Send a photo to a Telegram chat.
 
@@ -88,17 +184,153 @@ class TelegramNotifier:
             TelegramError: If there's an issue with the Telegram API
             FileNotFoundError: If the file doesn't exist
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+        content, filename = await _read_upload(file_path)
+
+        from telegram.error import TelegramError
 
         try:
-            with open(file_path, "rb") as file:
-                await self.bot.send_photo(chat_id=chat_id, photo=file, caption=caption)
+            await self.bot.send_photo(
+                chat_id=chat_id,
+                photo=content,
+                caption=caption,
+                filename=filename,
+            )
             return True
         except TelegramError as e:
             raise TelegramError(f"Failed to send photo: {e}")
 
 
+def _run(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion on the module's shared event loop.
+
+    The cached notifiers keep their HTTP connection pool between calls, and
+    those connections are bound to the loop they were opened on, so every
+    synchronous wrapper has to run on the same loop rather than asyncio.run.
+    Calls from several threads take turns on that loop.
+
+    Raises:
+        RuntimeError: If called while an event loop is running in this thread
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError(
+            "telegram_notifier's synchronous helpers cannot be used inside a "
+            "running event loop; await the TelegramNotifier methods instead"
+        )
+
+    global _loop
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+        return _loop.run_until_complete(coro)
+
+
+def _get_notifier(bot_token: str) -> TelegramNotifier:
+    """Return the shared TelegramNotifier for a bot token.
+
+    Instances are cached for the lifetime of the process and keyed on the
+    exact token string, so each distinct token keeps its own Bot alive until
+    they are shut down at interpreter exit.
+    """
+    with _lock:
+        notifier = _notifiers.get(bot_token)
+        if notifier is None:
+            notifier = _notifiers[bot_token] = TelegramNotifier(bot_token)
+        return notifier
+
+
+@atexit.register
+def _shutdown() -> None:
+    """Shut down cached notifiers and close the shared event loop."""
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            return
+        try:
+            for notifier in _notifiers.values():
+                _loop.run_until_complete(notifier.close())
+        finally:
+            _notifiers.clear()
+            _loop.close()
+
+
+async def send_notification_async(bot_token: str, chat_id: str, message: str) -> bool:
+    """Send a Telegram notification from async code.
+
+    Each call uses its own notifier rather than the cached ones, whose
+    connections are bound to the synchronous wrappers' private event loop.
+
+    Args:
+        bot_token: The Telegram bot token
+        chat_id: The target chat ID
+        message: The message text to send
+
+    Returns:
+        True if message was sent successfully, False otherwise
+
+    Raises:
+        TelegramError: If there's an issue with the Telegram API
+    """
+    notifier = TelegramNotifier(bot_token)
+    try:
+        return await notifier.send_message(chat_id, message)
+    finally:
+        await notifier.close()
+
+
+async def send_file_async(
+    bot_token: str, chat_id: str, file_path: str, caption: str | None = None
+) -> bool:
+    """Send a file to a Telegram chat from async code.
+
+    Args:
+        bot_token: The Telegram bot token
+        chat_id: The target chat ID
+        file_path: Path to the file to send
+        caption: Optional caption for the file
+
+    Returns:
+        True if file was sent successfully, False otherwise
+
+    Raises:
+        TelegramError: If there's an issue with the Telegram API
+        FileNotFoundError: If the file doesn't exist
+    """
+    notifier = TelegramNotifier(bot_token)
+    try:
+        return await notifier.send_document(chat_id, file_path, caption)
+    finally:
+        await notifier.close()
+
+
+async def send_photo_async(
+    bot_token: str, chat_id: str, file_path: str, caption: str | None = None
+) -> bool:
+    """Send a photo to a Telegram chat from async code.
+
+    Args:
+        bot_token: The Telegram bot token
+        chat_id: The target chat ID
+        file_path: Path to the image file to send
+        caption: Optional caption for the photo
+
+    Returns:
+        True if photo was sent successfully, False otherwise
+
+    Raises:
+        TelegramError: If there's an issue with the Telegram API
+        FileNotFoundError: If the file doesn't exist
+    """
+    notifier = TelegramNotifier(bot_token)
+    try:
+        return await notifier.send_photo(chat_id, file_path, caption)
+    finally:
+        await notifier.close()
+
+
 def send_notification(bot_token: str, chat_id: str, message: str) -> bool:
     """Send a Telegram notification (synchronous wrapper).
 
@@ -112,13 +344,14 @@ def send_notification(bot_token: str, chat_id: str, message: str) -> bool:
 
     Raises:
         TelegramError: If there's an issue with the Telegram API
+        RuntimeError: If called from a running event loop
     """
-    notifier = TelegramNotifier(bot_token)
-    return asyncio.run(notifier.send_message(chat_id, message))
+    notifier = _get_notifier(bot_token)
+    return _run(notifier.send_message(chat_id, message))
 
 
 def send_file(
-    bot_token: str, chat_id: str, file_path: str, caption: Optional[str] = None
+    bot_token: str, chat_id: str, file_path: str, caption: str | None = None
 ) -> bool:
     """Send a file to a Telegram chat (synchronous wrapper).
 
@@ -134,13 +367,14 @@ def send_file(
     Raises:
         TelegramError: If there's an issue with the Telegram API
         FileNotFoundError: If the file doesn't exist
+        RuntimeError: If called from a running event loop
     """
-    notifier = TelegramNotifier(bot_token)
-    return asyncio.run(notifier.send_document(chat_id, file_path, caption))
+    notifier = _get_notifier(bot_token)
+    return _run(notifier.send_document(chat_id, file_path, caption))
 
 
 def send_photo(
-    bot_token: str, chat_id: str, file_path: str, caption: Optional[str] = None
+    bot_token: str, chat_id: str, file_path: str, caption: str | None = None
 ) -> bool:
     """Send a photo to a Telegram chat (synchronous wrapper).
 
@@ -156,6 +390,22 @@ def send_photo(
     Raises:
         TelegramError: If there's an issue with the Telegram API
         FileNotFoundError: If the file doesn't exist
+        RuntimeError: If called from a running event loop
     """
-    notifier = TelegramNotifier(bot_token)
-    return asyncio.run(notifier.send_photo(chat_id, file_path, caption))
+    notifier = _get_notifier(bot_token)
+    return _run(notifier.send_photo(chat_id, file_path, caption))
+
+
+def send_many(bot_token: str, jobs: Iterable[tuple[str, str]]) -> None:
+    """Send several messages concurrently, rate limited (synchronous wrapper).
+
+    Args:
+        bot_token: The Telegram bot token
+        jobs: (chat_id, message) pairs to send
+
+    Raises:
+        TelegramError: If any message fails to send
+        RuntimeError: If called from a running event loop
+    """
+    notifier = _get_notifier(bot_token)
+    _run(notifier.send_many(jobs))
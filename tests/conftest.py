@@ -1,17 +1,76 @@
 """Test configuration and fixtures."""
 
 import pytest
-from unittest.mock import Mock
+from typing import Iterator, Tuple
+from unittest.mock import AsyncMock, Mock
+from pytest_mock import MockerFixture
+from telegram import Bot
+
+from telegram_notifier.notifier import TelegramNotifier, _notifiers, _run
+
+
+@pytest.fixture(autouse=True)
+def clear_notifier_cache() -> Iterator[None]:
+    """Drop notifiers cached by the synchronous wrappers between tests."""
+    _notifiers.clear()
+    yield
+    _notifiers.clear()
+
+
+@pytest.fixture(scope="class")
+def _wrapper_mocks(class_mocker: MockerFixture) -> Tuple[Mock, Mock]:
+    """Patch TelegramNotifier and spy on _run once for a whole test class.
+
+    _run still drives the coroutine the wrapper builds, so the mocked
+    notifier methods are really awaited and their errors really propagate.
+    """
+    return (
+        class_mocker.patch("telegram_notifier.notifier.TelegramNotifier"),
+        class_mocker.patch("telegram_notifier.notifier._run", wraps=_run),
+    )
+
+
+@pytest.fixture
+def patched_notifier(_wrapper_mocks: Tuple[Mock, Mock]) -> Tuple[Mock, Mock]:
+    """Return the patched (TelegramNotifier, _run) pair, reset for this test."""
+    for mock in _wrapper_mocks:
+        mock.reset_mock(return_value=True, side_effect=True)
+    return _wrapper_mocks
+
+
+@pytest.fixture(scope="session")
+def dummy_pdf(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Path to a small document shared by every test that only reads it."""
+    path = tmp_path_factory.mktemp("data") / "test_document.pdf"
+    path.write_text("Test document content")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def dummy_jpg(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Path to a small image shared by every test that only reads it."""
+    path = tmp_path_factory.mktemp("data") / "test_image.jpg"
+    path.write_bytes(b"fake image data")
+    return str(path)
 
 
 @pytest.fixture
 def mock_bot() -> Mock:
-    """Create a mock Telegram bot."""
-    bot = Mock()
+    """Create a mock Telegram bot whose coroutine methods are AsyncMocks."""
+    bot = Mock(spec=Bot)
     bot.token = "test_token"
+    bot.request.shutdown = AsyncMock()
     return bot
 
 
+@pytest.fixture
+def notifier(mock_bot: Mock) -> TelegramNotifier:
+    """Return a TelegramNotifier driving mock_bot, without building a real Bot."""
+    notifier = TelegramNotifier.__new__(TelegramNotifier)
+    notifier.bot = mock_bot
+    return notifier
+
+
 @pytest.fixture
 def sample_chat_id() -> str:
     """Sample chat ID for testing."""
@@ -1,12 +1,17 @@
 """Tests for the CLI interface."""
 
 import os
-from unittest.mock import Mock, patch
+import sys
 import pytest
+from pytest_mock import MockerFixture
 from click.testing import CliRunner
 from telegram.error import TelegramError
 
+from telegram_notifier import __version__
+from telegram_notifier.__main__ import main
 from telegram_notifier.cli import cli
+from telegram_notifier.cli import main as cli_main
+from telegram_notifier.daemon import DaemonError
 
 
 class TestCLI:
@@ -16,9 +21,9 @@ class TestCLI:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
-    @patch("telegram_notifier.cli.send_notification")
-    def test_send_command_with_args_success(self, mock_send: Mock) -> None:
+    def test_send_command_with_args_success(self, mocker: MockerFixture) -> None:
         """Test send command with command-line arguments."""
+        mock_send = mocker.patch("telegram_notifier.notifier.send_notification")
         mock_send.return_value = True
 
         result = self.runner.invoke(
@@ -38,12 +43,13 @@ class TestCLI:
         assert "Message sent successfully!" in result.output
         mock_send.assert_called_once_with("test_token", "123456789", "Test message")
 
-    @patch("telegram_notifier.cli.send_notification")
-    @patch.dict(
-        os.environ, {"TELEGRAM_BOT_TOKEN": "env_token", "TELEGRAM_CHAT_ID": "987654321"}
-    )
-    def test_send_command_with_env_vars(self, mock_send: Mock) -> None:
+    def test_send_command_with_env_vars(self, mocker: MockerFixture) -> None:
         """Test send command using environment variables."""
+        mocker.patch.dict(
+            os.environ,
+            {"TELEGRAM_BOT_TOKEN": "env_token", "TELEGRAM_CHAT_ID": "987654321"},
+        )
+        mock_send = mocker.patch("telegram_notifier.notifier.send_notification")
         mock_send.return_value = True
 
         result = self.runner.invoke(cli, ["send", "--message", "Test message from env"])
@@ -61,7 +67,7 @@ class TestCLI:
         )
 
         assert result.exit_code == 1
-        assert "Bot token is required" in result.output
+        assert "Error: Bot token is required" in result.output
 
     def test_send_command_missing_chat_id(self) -> None:
         """Test send command with missing chat ID."""
@@ -70,7 +76,7 @@ class TestCLI:
         )
 
         assert result.exit_code == 1
-        assert "Chat ID is required" in result.output
+        assert "Error: Chat ID is required" in result.output
 
     def test_send_command_missing_message(self) -> None:
         """Test send command with missing message."""
@@ -80,9 +86,9 @@ class TestCLI:
 
         assert result.exit_code == 2  # Click error for missing required option
 
-    @patch("telegram_notifier.cli.send_notification")
-    def test_send_command_telegram_error(self, mock_send: Mock) -> None:
+    def test_send_command_telegram_error(self, mocker: MockerFixture) -> None:
         """Test send command with Telegram API error."""
+        mock_send = mocker.patch("telegram_notifier.notifier.send_notification")
         mock_send.side_effect = TelegramError("Invalid token")
 
         result = self.runner.invoke(
@@ -101,10 +107,31 @@ class TestCLI:
         assert result.exit_code == 1
         assert "Telegram API error: Invalid token" in result.output
 
-    @patch("telegram_notifier.cli.send_notification")
-    def test_send_command_unexpected_error(self, mock_send: Mock) -> None:
+    def test_send_command_unexpected_error(self, mocker: MockerFixture) -> None:
         """Test send command with unexpected error."""
-        mock_send.side_effect = Exception("Unexpected error")
+        mock_send = mocker.patch("telegram_notifier.notifier.send_notification")
+        mock_send.side_effect = OSError("Connection reset")
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "send",
+                "--token",
+                "test_token",
+                "--chat-id",
+                "123456789",
+                "--message",
+                "Test message",
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "Unexpected error: Connection reset" in result.output
+
+    def test_send_command_bug_propagates(self, mocker: MockerFixture) -> None:
+        """Test that programming errors are not swallowed as send failures."""
+        mock_send = mocker.patch("telegram_notifier.notifier.send_notification")
+        mock_send.side_effect = RuntimeError("Internal bug")
 
         result = self.runner.invoke(
             cli,
@@ -120,11 +147,12 @@ class TestCLI:
         )
 
         assert result.exit_code == 1
-        assert "Unexpected error: Unexpected error" in result.output
+        assert isinstance(result.exception, RuntimeError)
+        assert "Unexpected error" not in result.output
 
-    @patch("telegram_notifier.cli.send_notification")
-    def test_send_command_false_return(self, mock_send: Mock) -> None:
+    def test_send_command_false_return(self, mocker: MockerFixture) -> None:
         """Test send command when send_notification returns False."""
+        mock_send = mocker.patch("telegram_notifier.notifier.send_notification")
         mock_send.return_value = False
 
         result = self.runner.invoke(
@@ -143,12 +171,153 @@ class TestCLI:
         assert result.exit_code == 1
         assert "Failed to send message" in result.output
 
+    def test_send_command_file_of_messages(
+        self, mocker: MockerFixture, tmp_path
+    ) -> None:
+        """Test send command with a tab-separated file of messages."""
+        mock_send = mocker.patch("telegram_notifier.notifier.send_many")
+        mock_send.return_value = None
+        messages = tmp_path / "messages.tsv"
+        messages.write_text("123456789\tFirst message\n\n987654321\tSecond\tpart\n")
+
+        result = self.runner.invoke(
+            cli,
+            ["send", "--token", "test_token", "--file-of-messages", str(messages)],
+        )
+
+        assert result.exit_code == 0
+        assert "2 messages sent successfully!" in result.output
+        mock_send.assert_called_once_with(
+            "test_token",
+            [("123456789", "First message"), ("987654321", "Second\tpart")],
+        )
+
+    def test_send_command_malformed_file_of_messages(self, tmp_path) -> None:
+        """Test send command with a line that has no chat ID separator."""
+        messages = tmp_path / "messages.tsv"
+        messages.write_text("123456789\tFirst message\nno separator\n")
+
+        result = self.runner.invoke(
+            cli,
+            ["send", "--token", "test_token", "--file-of-messages", str(messages)],
+        )
+
+        assert result.exit_code == 1
+        assert f"{messages}:2: expected 'chat_id<TAB>message'" in result.output
+
+    def test_send_command_undecodable_file_of_messages(self, tmp_path) -> None:
+        """Test send command with a line that is not valid UTF-8."""
+        messages = tmp_path / "messages.tsv"
+        messages.write_bytes(b"123456789\tFirst message\n123\t\xff\n")
+
+        result = self.runner.invoke(
+            cli,
+            ["send", "--token", "test_token", "--file-of-messages", str(messages)],
+        )
+
+        assert result.exit_code == 1
+        assert f"{messages}:2: not valid UTF-8" in result.output
+
+    def test_send_command_message_and_file_of_messages(self, tmp_path) -> None:
+        """Test that --message and --file-of-messages are mutually exclusive."""
+        messages = tmp_path / "messages.tsv"
+        messages.write_text("123456789\tFirst message\n")
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "send",
+                "--token",
+                "test_token",
+                "--message",
+                "Test message",
+                "--file-of-messages",
+                str(messages),
+            ],
+        )
+
+        assert result.exit_code == 2
+        assert "mutually exclusive" in result.output
+
+    def test_send_command_via_daemon(self, mocker: MockerFixture) -> None:
+        """Test send command delivering through a running daemon."""
+        mocker.patch.dict(os.environ)
+        os.environ.pop("TELEGRAM_BOT_TOKEN", None)
+        mock_daemon_send = mocker.patch("telegram_notifier.daemon.send_via_daemon")
+        mock_send = mocker.patch("telegram_notifier.notifier.send_notification")
+        result = self.runner.invoke(
+            cli,
+            ["send", "--via-daemon", "--chat-id", "123456789", "--message", "Hi"],
+        )
+
+        assert result.exit_code == 0
+        assert "Message sent successfully!" in result.output
+        mock_daemon_send.assert_called_once_with("123456789", "Hi", bot_token=None)
+        mock_send.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "args, expected_token",
+        [([], "env_token"), (["--token", "cli_token"], "cli_token")],
+    )
+    def test_send_command_via_daemon_token(
+        self, mocker: MockerFixture, args: list, expected_token: str
+    ) -> None:
+        """Test send command passing the bot token on to the daemon."""
+        mocker.patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "env_token"})
+        mock_daemon_send = mocker.patch("telegram_notifier.daemon.send_via_daemon")
+
+        result = self.runner.invoke(
+            cli,
+            ["send", "--via-daemon", "--chat-id", "1", "--message", "Hi", *args],
+        )
+
+        assert result.exit_code == 0
+        mock_daemon_send.assert_called_once_with("1", "Hi", bot_token=expected_token)
+
+    def test_send_command_via_daemon_fallback(self, mocker: MockerFixture) -> None:
+        """Test send command falling back when no daemon is running."""
+        mock_daemon_send = mocker.patch("telegram_notifier.daemon.send_via_daemon")
+        mock_send = mocker.patch("telegram_notifier.notifier.send_notification")
+        mock_daemon_send.side_effect = FileNotFoundError("No such file")
+        mock_send.return_value = True
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "send",
+                "--via-daemon",
+                "--token",
+                "test_token",
+                "--chat-id",
+                "123456789",
+                "--message",
+                "Hi",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Message sent successfully!" in result.output
+        mock_send.assert_called_once_with("test_token", "123456789", "Hi")
+
+    def test_send_command_via_daemon_error(self, mocker: MockerFixture) -> None:
+        """Test send command when the daemon fails to send."""
+        mock_daemon_send = mocker.patch("telegram_notifier.daemon.send_via_daemon")
+        mock_daemon_send.side_effect = DaemonError("Chat not found")
+
+        result = self.runner.invoke(
+            cli,
+            ["send", "--via-daemon", "--chat-id", "123456789", "--message", "Hi"],
+        )
+
+        assert result.exit_code == 1
+        assert "Daemon error: Chat not found" in result.output
+
     def test_version_option(self) -> None:
         """Test --version option."""
         result = self.runner.invoke(cli, ["--version"])
 
         assert result.exit_code == 0
-        # Version should be displayed (from package metadata)
+        assert f"version {__version__}" in result.output
 
     def test_help_output(self) -> None:
         """Test help output."""
@@ -157,3 +326,44 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Telegram Notifier" in result.output
         assert "Send messages to Telegram chats" in result.output
+        for command in ("send", "send-file-cmd", "send-photo-cmd"):
+            assert command in result.output
+
+    def test_unknown_command(self) -> None:
+        """Test that unknown subcommands are rejected."""
+        result = self.runner.invoke(cli, ["send-sticker"])
+
+        assert result.exit_code == 2
+        assert "No such command" in result.output
+
+
+class TestMain:
+    """Tests for the console entry point."""
+
+    def test_main_version(
+        self, mocker: MockerFixture, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test that main answers --version directly."""
+        mocker.patch.object(sys, "argv", ["telegram-notifier", "--version"])
+
+        main()
+
+        assert capsys.readouterr().out == f"telegram-notifier, version {__version__}\n"
+
+    def test_cli_main_alias(self) -> None:
+        """Test that the old telegram_notifier.cli:main entry point still works."""
+        assert cli_main is main
+
+    def test_main_delegates_to_cli(
+        self, mocker: MockerFixture, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test that main hands other arguments to the click group."""
+        mocker.patch.object(sys, "argv", ["telegram-notifier", "send", "--help"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 0
+        output = capsys.readouterr().out
+        assert "Usage: telegram-notifier send" in output
+        assert "--file-of-messages" in output
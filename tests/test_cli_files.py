@@ -1,8 +1,8 @@
 """Tests for file sending CLI commands."""
 
 import os
-from unittest.mock import Mock, patch
 import pytest
+from pytest_mock import MockerFixture
 from click.testing import CliRunner
 from telegram.error import TelegramError
 
@@ -16,14 +16,11 @@ class TestSendFileCommand:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
-    @patch("telegram_notifier.cli.send_file")
-    def test_send_file_success(self, mock_send: Mock, tmp_path) -> None:
+    def test_send_file_success(self, mocker: MockerFixture, dummy_pdf: str) -> None:
         """Test send-file-cmd command success."""
+        mock_send = mocker.patch("telegram_notifier.notifier.send_file")
         mock_send.return_value = True
 
-        test_file = tmp_path / "test_document.pdf"
-        test_file.write_text("test content")
-
         result = self.runner.invoke(
             cli,
             [
@@ -33,56 +30,48 @@ class TestSendFileCommand:
                 "--chat-id",
                 "123456789",
                 "--file",
-                str(test_file),
+                dummy_pdf,
                 "--caption",
                 "Test file",
             ],
         )
 
         assert result.exit_code == 0
-        assert f"File '{test_file}' sent successfully!" in result.output
+        assert f"File '{dummy_pdf}' sent successfully!" in result.output
         mock_send.assert_called_once_with(
-            "test_token", "123456789", str(test_file), "Test file"
+            "test_token", "123456789", dummy_pdf, "Test file"
         )
 
-    @patch("telegram_notifier.cli.send_file")
-    @patch.dict(
-        os.environ, {"TELEGRAM_BOT_TOKEN": "env_token", "TELEGRAM_CHAT_ID": "987654321"}
-    )
-    def test_send_file_with_env_vars(self, mock_send: Mock, tmp_path) -> None:
+    def test_send_file_with_env_vars(
+        self, mocker: MockerFixture, dummy_pdf: str
+    ) -> None:
         """Test send-file-cmd command using environment variables."""
+        mocker.patch.dict(
+            os.environ,
+            {"TELEGRAM_BOT_TOKEN": "env_token", "TELEGRAM_CHAT_ID": "987654321"},
+        )
+        mock_send = mocker.patch("telegram_notifier.notifier.send_file")
         mock_send.return_value = True
 
-        test_file = tmp_path / "test_document.pdf"
-        test_file.write_text("test content")
-
-        result = self.runner.invoke(cli, ["send-file-cmd", "--file", str(test_file)])
+        result = self.runner.invoke(cli, ["send-file-cmd", "--file", dummy_pdf])
 
         assert result.exit_code == 0
-        assert f"File '{test_file}' sent successfully!" in result.output
-        mock_send.assert_called_once_with(
-            "env_token", "987654321", str(test_file), None
-        )
+        assert f"File '{dummy_pdf}' sent successfully!" in result.output
+        mock_send.assert_called_once_with("env_token", "987654321", dummy_pdf, None)
 
-    def test_send_file_missing_token(self, tmp_path) -> None:
+    def test_send_file_missing_token(self, dummy_pdf: str) -> None:
         """Test send-file-cmd command with missing token."""
-        test_file = tmp_path / "test_document.pdf"
-        test_file.write_text("test content")
-
         result = self.runner.invoke(
-            cli, ["send-file-cmd", "--chat-id", "123456789", "--file", str(test_file)]
+            cli, ["send-file-cmd", "--chat-id", "123456789", "--file", dummy_pdf]
         )
 
         assert result.exit_code == 1
         assert "Bot token is required" in result.output
 
-    def test_send_file_missing_chat_id(self, tmp_path) -> None:
+    def test_send_file_missing_chat_id(self, dummy_pdf: str) -> None:
         """Test send-file-cmd command with missing chat ID."""
-        test_file = tmp_path / "test_document.pdf"
-        test_file.write_text("test content")
-
         result = self.runner.invoke(
-            cli, ["send-file-cmd", "--token", "test_token", "--file", str(test_file)]
+            cli, ["send-file-cmd", "--token", "test_token", "--file", dummy_pdf]
         )
 
         assert result.exit_code == 1
@@ -105,14 +94,13 @@ class TestSendFileCommand:
 
         assert result.exit_code == 2  # Click error for non-existent file
 
-    @patch("telegram_notifier.cli.send_file")
-    def test_send_file_telegram_error(self, mock_send: Mock, tmp_path) -> None:
+    def test_send_file_telegram_error(
+        self, mocker: MockerFixture, dummy_pdf: str
+    ) -> None:
         """Test send-file-cmd command with Telegram API error."""
+        mock_send = mocker.patch("telegram_notifier.notifier.send_file")
         mock_send.side_effect = TelegramError("File too large")
 
-        test_file = tmp_path / "test_document.pdf"
-        test_file.write_text("test content")
-
         result = self.runner.invoke(
             cli,
             [
@@ -122,13 +110,36 @@ class TestSendFileCommand:
                 "--chat-id",
                 "123456789",
                 "--file",
-                str(test_file),
+                dummy_pdf,
             ],
         )
 
         assert result.exit_code == 1
         assert "Telegram API error: File too large" in result.output
 
+    def test_send_file_removed_before_send(
+        self, mocker: MockerFixture, dummy_pdf: str
+    ) -> None:
+        """Test send-file-cmd command when the file disappears before sending."""
+        mock_send = mocker.patch("telegram_notifier.notifier.send_file")
+        mock_send.side_effect = FileNotFoundError(f"File not found: {dummy_pdf}")
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "send-file-cmd",
+                "--token",
+                "test_token",
+                "--chat-id",
+                "123456789",
+                "--file",
+                dummy_pdf,
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert f"File error: File not found: {dummy_pdf}" in result.output
+
 
 class TestSendPhotoCommand:
     """Tests for the send-photo-cmd CLI command."""
@@ -137,14 +148,11 @@ class TestSendPhotoCommand:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
-    @patch("telegram_notifier.cli.send_photo")
-    def test_send_photo_success(self, mock_send: Mock, tmp_path) -> None:
+    def test_send_photo_success(self, mocker: MockerFixture, dummy_jpg: str) -> None:
         """Test send-photo-cmd command success."""
+        mock_send = mocker.patch("telegram_notifier.notifier.send_photo")
         mock_send.return_value = True
 
-        test_file = tmp_path / "test_image.jpg"
-        test_file.write_bytes(b"fake image data")
-
         result = self.runner.invoke(
             cli,
             [
@@ -154,57 +162,51 @@ class TestSendPhotoCommand:
                 "--chat-id",
                 "123456789",
                 "--file",
-                str(test_file),
+                dummy_jpg,
                 "--caption",
                 "Test photo",
             ],
         )
 
         assert result.exit_code == 0
-        assert f"Photo '{test_file}' sent successfully!" in result.output
+        assert f"Photo '{dummy_jpg}' sent successfully!" in result.output
         mock_send.assert_called_once_with(
-            "test_token", "123456789", str(test_file), "Test photo"
+            "test_token", "123456789", dummy_jpg, "Test photo"
         )
 
-    @patch("telegram_notifier.cli.send_photo")
-    @patch.dict(
-        os.environ, {"TELEGRAM_BOT_TOKEN": "env_token", "TELEGRAM_CHAT_ID": "987654321"}
-    )
-    def test_send_photo_with_env_vars(self, mock_send: Mock, tmp_path) -> None:
+    def test_send_photo_with_env_vars(
+        self, mocker: MockerFixture, dummy_jpg: str
+    ) -> None:
         """Test send-photo-cmd command using environment variables."""
+        mocker.patch.dict(
+            os.environ,
+            {"TELEGRAM_BOT_TOKEN": "env_token", "TELEGRAM_CHAT_ID": "987654321"},
+        )
+        mock_send = mocker.patch("telegram_notifier.notifier.send_photo")
         mock_send.return_value = True
 
-        test_file = tmp_path / "test_image.jpg"
-        test_file.write_bytes(b"fake image data")
-
-        result = self.runner.invoke(cli, ["send-photo-cmd", "--file", str(test_file)])
+        result = self.runner.invoke(cli, ["send-photo-cmd", "--file", dummy_jpg])
 
         assert result.exit_code == 0
-        assert f"Photo '{test_file}' sent successfully!" in result.output
-        mock_send.assert_called_once_with(
-            "env_token", "987654321", str(test_file), None
-        )
+        assert f"Photo '{dummy_jpg}' sent successfully!" in result.output
+        mock_send.assert_called_once_with("env_token", "987654321", dummy_jpg, None)
 
-    def test_send_photo_missing_token(self, tmp_path) -> None:
+    def test_send_photo_missing_token(self, dummy_jpg: str) -> None:
         """Test send-photo-cmd command with missing token."""
-        test_file = tmp_path / "test_image.jpg"
-        test_file.write_bytes(b"fake image data")
-
         result = self.runner.invoke(
-            cli, ["send-photo-cmd", "--chat-id", "123456789", "--file", str(test_file)]
+            cli, ["send-photo-cmd", "--chat-id", "123456789", "--file", dummy_jpg]
         )
 
         assert result.exit_code == 1
         assert "Bot token is required" in result.output
 
-    @patch("telegram_notifier.cli.send_photo")
-    def test_send_photo_telegram_error(self, mock_send: Mock, tmp_path) -> None:
+    def test_send_photo_telegram_error(
+        self, mocker: MockerFixture, dummy_jpg: str
+    ) -> None:
         """Test send-photo-cmd command with Telegram API error."""
+        mock_send = mocker.patch("telegram_notifier.notifier.send_photo")
         mock_send.side_effect = TelegramError("Invalid image format")
 
-        test_file = tmp_path / "test_image.jpg"
-        test_file.write_bytes(b"fake image data")
-
         result = self.runner.invoke(
             cli,
             [
@@ -214,7 +216,7 @@ class TestSendPhotoCommand:
                 "--chat-id",
                 "123456789",
                 "--file",
-                str(test_file),
+                dummy_jpg,
             ],
         )
 
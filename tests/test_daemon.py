@@ -0,0 +1,211 @@
+"""Tests for the background send daemon."""
+
+import asyncio
+import os
+import socket
+import stat
+from functools import partial
+from typing import AsyncIterator, Tuple
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+from telegram.error import TelegramError
+
+from telegram_notifier.daemon import (
+    DaemonError,
+    default_socket_path,
+    send_via_daemon,
+    serve,
+)
+
+
+@pytest_asyncio.fixture
+async def daemon(tmp_path) -> AsyncIterator[Tuple[Mock, str]]:
+    """Run the daemon with a mock notifier on a temporary socket."""
+    path = str(tmp_path / "daemon.sock")
+    notifier = Mock()
+    notifier.bot.token = "test_token"
+    notifier.send_message = AsyncMock(return_value=True)
+
+    task = asyncio.ensure_future(serve(notifier, path))
+    while not os.path.exists(path):
+        await asyncio.sleep(0.01)
+
+    yield notifier, path
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+async def _send(*args: str) -> None:
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, send_via_daemon, *args)
+
+
+class TestDaemon:
+    """Tests for the daemon server and client."""
+
+    @pytest.mark.asyncio
+    async def test_send_via_daemon(self, daemon: Tuple[Mock, str]) -> None:
+        """Test that a message sent to the daemon reaches the notifier."""
+        notifier, path = daemon
+
+        await _send("123456789", "Test message", path)
+
+        notifier.send_message.assert_awaited_once_with("123456789", "Test message")
+
+    @pytest.mark.asyncio
+    async def test_send_via_daemon_telegram_error(
+        self, daemon: Tuple[Mock, str]
+    ) -> None:
+        """Test that a Telegram error in the daemon is reported to the client."""
+        notifier, path = daemon
+        notifier.send_message.side_effect = TelegramError("Chat not found")
+
+        with pytest.raises(DaemonError, match="Chat not found"):
+            await _send("invalid_chat_id", "Test message", path)
+
+    @pytest.mark.asyncio
+    async def test_send_via_daemon_matching_token(
+        self, daemon: Tuple[Mock, str]
+    ) -> None:
+        """Test that a request carrying the daemon's own token is sent."""
+        notifier, path = daemon
+        loop = asyncio.get_running_loop()
+
+        await loop.run_in_executor(
+            None,
+            partial(
+                send_via_daemon, "123", "Test message", path, bot_token="test_token"
+            ),
+        )
+
+        notifier.send_message.assert_awaited_once_with("123", "Test message")
+
+    @pytest.mark.asyncio
+    async def test_send_via_daemon_token_mismatch(
+        self, daemon: Tuple[Mock, str]
+    ) -> None:
+        """Test that a request for a different bot is refused."""
+        notifier, path = daemon
+        loop = asyncio.get_running_loop()
+
+        with pytest.raises(DaemonError, match="does not match"):
+            await loop.run_in_executor(
+                None,
+                partial(
+                    send_via_daemon, "123", "Test message", path, bot_token="other"
+                ),
+            )
+        notifier.send_message.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_bad_request(self, daemon: Tuple[Mock, str]) -> None:
+        """Test that malformed requests are answered without sending."""
+        notifier, path = daemon
+        reader, writer = await asyncio.open_unix_connection(path)
+
+        writer.write(b"not json\n")
+        reply = await reader.readline()
+        writer.close()
+
+        assert b'"ok": false' in reply
+        assert b"Bad request" in reply
+        notifier.send_message.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_socket_owner_only(self, daemon: Tuple[Mock, str]) -> None:
+        """Test that the socket is not accessible to other users."""
+        _, path = daemon
+
+        assert stat.S_IMODE(os.stat(path).st_mode) & 0o077 == 0
+
+    @pytest.mark.asyncio
+    async def test_refuses_live_socket(self, daemon: Tuple[Mock, str]) -> None:
+        """Test that a second daemon does not take over a live socket."""
+        _, path = daemon
+
+        with pytest.raises(RuntimeError, match="already listening"):
+            await serve(Mock(), path)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("reply", [b"garbage\n", b"[1]\n"])
+    async def test_malformed_reply(self, tmp_path, reply: bytes) -> None:
+        """Test that an unparseable reply is reported as a DaemonError."""
+        path = str(tmp_path / "garbage.sock")
+
+        async def handle(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            await reader.readline()
+            writer.write(reply)
+            await writer.drain()
+            writer.close()
+
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(handle, path=path)
+        finally:
+            os.umask(old_umask)
+
+        async with server:
+            with pytest.raises(DaemonError, match="Malformed reply"):
+                await _send("123456789", "Test message", path)
+
+    def test_no_daemon(self, tmp_path) -> None:
+        """Test that the client reports a missing daemon as FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            send_via_daemon("123456789", "Test message", str(tmp_path / "none.sock"))
+
+    def test_stale_socket(self, tmp_path) -> None:
+        """Test that a socket with no listener is refused."""
+        path = str(tmp_path / "stale.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(path)
+        os.chmod(path, 0o600)
+
+        with pytest.raises(ConnectionRefusedError):
+            send_via_daemon("123456789", "Test message", path)
+
+    @pytest.mark.asyncio
+    async def test_refuses_shared_socket(self, daemon: Tuple[Mock, str]) -> None:
+        """Test that the client will not use a socket other users can open."""
+        notifier, path = daemon
+        os.chmod(path, 0o666)
+
+        with pytest.raises(DaemonError, match="accessible to other users"):
+            await _send("123456789", "Test message", path)
+        notifier.send_message.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_refuses_foreign_socket(
+        self, daemon: Tuple[Mock, str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the client will not use a socket owned by another user."""
+        notifier, path = daemon
+        uid = os.getuid()
+        monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+
+        with pytest.raises(DaemonError, match="not owned by the current user"):
+            await _send("123456789", "Test message", path)
+        notifier.send_message.assert_not_awaited()
+
+
+class TestDefaultSocketPath:
+    """Tests for default_socket_path."""
+
+    def test_explicit_socket(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that TELEGRAM_NOTIFIER_SOCKET takes precedence."""
+        monkeypatch.setenv("TELEGRAM_NOTIFIER_SOCKET", "/tmp/custom.sock")
+        monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+
+        assert default_socket_path() == "/tmp/custom.sock"
+
+    def test_runtime_dir(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the socket lives in XDG_RUNTIME_DIR when set."""
+        monkeypatch.delenv("TELEGRAM_NOTIFIER_SOCKET", raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+
+        assert default_socket_path() == "/run/user/1000/telegram-notifier.sock"
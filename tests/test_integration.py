@@ -1,85 +1,60 @@
 """Integration tests for error handling and edge cases."""
 
+import re
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
-from telegram.error import TelegramError, NetworkError
+from typing import Tuple
+from unittest.mock import AsyncMock, Mock
+from telegram.error import BadRequest, InvalidToken, NetworkError, TelegramError
 
 from telegram_notifier.notifier import TelegramNotifier, send_notification
 
+# Longer than Telegram's 4096-character message limit
+_LONG_MESSAGE = "A" * 5000
+_SPECIAL_MESSAGE = "Test with émojis 🚀 and spëcial chars: <>&"
 
-class TestErrorHandling:
-    """Test error handling scenarios."""
+_FAIL_SEND_MSG = re.compile(r"^Failed to send message: ")
 
-    @pytest.mark.asyncio
-    @patch("telegram.Bot.send_message", new_callable=AsyncMock)
-    async def test_unauthorized_error(self, mock_send_message: AsyncMock) -> None:
-        """Test handling of unauthorized bot token."""
-        notifier = TelegramNotifier("invalid_token")
-        mock_send_message.side_effect = TelegramError("Unauthorized")
 
-        with pytest.raises(TelegramError, match="Failed to send message: Unauthorized"):
-            await notifier.send_message("123456789", "Test message")
+class TestErrorHandling:
+    """Test error handling scenarios."""
 
     @pytest.mark.asyncio
-    @patch("telegram.Bot.send_message", new_callable=AsyncMock)
-    async def test_network_error(self, mock_send_message: AsyncMock) -> None:
-        """Test handling of network errors."""
-        notifier = TelegramNotifier("test_token")
-        mock_send_message.side_effect = NetworkError("Connection timeout")
-
-        with pytest.raises(
-            TelegramError, match="Failed to send message: Connection timeout"
-        ):
+    @pytest.mark.parametrize(
+        "error",
+        [
+            InvalidToken(),
+            NetworkError("Connection timeout"),
+            BadRequest("Chat not found"),
+        ],
+        ids=["unauthorized", "network", "invalid_chat_id"],
+    )
+    async def test_send_message_error(
+        self, notifier: TelegramNotifier, mock_bot: Mock, error: TelegramError
+    ) -> None:
+        """Test that Telegram API errors are reported as send failures."""
+        mock_bot.send_message.side_effect = error
+
+        with pytest.raises(TelegramError, match=_FAIL_SEND_MSG) as exc_info:
             await notifier.send_message("123456789", "Test message")
 
-    @pytest.mark.asyncio
-    @patch("telegram.Bot.send_message", new_callable=AsyncMock)
-    async def test_invalid_chat_id(self, mock_send_message: AsyncMock) -> None:
-        """Test handling of invalid chat ID."""
-        notifier = TelegramNotifier("test_token")
-        mock_send_message.side_effect = TelegramError("Chat not found")
-
-        with pytest.raises(
-            TelegramError, match="Failed to send message: Chat not found"
-        ):
-            await notifier.send_message("invalid_chat_id", "Test message")
-
-    def test_empty_message(self) -> None:
-        """Test sending empty message."""
-        with patch("telegram_notifier.notifier.TelegramNotifier") as mock_class:
-            mock_instance = Mock()
-            mock_instance.send_message = AsyncMock(return_value=True)
-            mock_class.return_value = mock_instance
-
-            with patch("asyncio.run") as mock_run:
-                mock_run.return_value = True
-                result = send_notification("test_token", "123456789", "")
-                assert result is True
-
-    def test_long_message(self) -> None:
-        """Test sending very long message."""
-        long_message = "A" * 5000  # Very long message
-
-        with patch("telegram_notifier.notifier.TelegramNotifier") as mock_class:
-            mock_instance = Mock()
-            mock_instance.send_message = AsyncMock(return_value=True)
-            mock_class.return_value = mock_instance
-
-            with patch("asyncio.run") as mock_run:
-                mock_run.return_value = True
-                result = send_notification("test_token", "123456789", long_message)
-                assert result is True
-
-    def test_special_characters_in_message(self) -> None:
-        """Test sending message with special characters."""
-        special_message = "Test with émojis 🚀 and spëcial chars: <>&"
-
-        with patch("telegram_notifier.notifier.TelegramNotifier") as mock_class:
-            mock_instance = Mock()
-            mock_instance.send_message = AsyncMock(return_value=True)
-            mock_class.return_value = mock_instance
-
-            with patch("asyncio.run") as mock_run:
-                mock_run.return_value = True
-                result = send_notification("test_token", "123456789", special_message)
-                assert result is True
+        assert str(exc_info.value).endswith(str(error))
+
+    @pytest.mark.parametrize(
+        "message",
+        ["", _LONG_MESSAGE, _SPECIAL_MESSAGE],
+        ids=["empty", "long", "special_characters"],
+    )
+    def test_unusual_message(
+        self, patched_notifier: Tuple[Mock, Mock], message: str
+    ) -> None:
+        """Test sending empty, very long and non-ASCII messages."""
+        mock_class, mock_run = patched_notifier
+        mock_class.return_value.send_message = AsyncMock(return_value=True)
+
+        result = send_notification("test_token", "123456789", message)
+
+        assert result is True
+        mock_run.assert_called_once()
+        mock_class.return_value.send_message.assert_awaited_once_with(
+            "123456789", message
+        )
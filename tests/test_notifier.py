@@ -1,16 +1,37 @@
 """Tests for the core notifier module."""
 
+import asyncio
+import re
+import threading
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+from pytest_mock import MockerFixture
+from typing import Awaitable, Callable, Tuple
+from unittest.mock import AsyncMock, Mock
 from telegram.error import TelegramError
 
 from telegram_notifier.notifier import (
     TelegramNotifier,
     send_notification,
+    send_notification_async,
     send_file,
+    send_file_async,
     send_photo,
+    send_photo_async,
+    send_many,
+    _get_notifier,
+    _notifiers,
+    _run,
+    _shutdown,
 )
 
+_FAIL_SEND_DOC = re.compile(r"^Failed to send document: ")
+_FAIL_SEND_PHOTO = re.compile(r"^Failed to send photo: ")
+_MISSING_PDF = "/nonexistent/file.pdf"
+_MISSING_JPG = "/nonexistent/image.jpg"
+_PDF_NOT_FOUND = re.compile(f"^File not found: {re.escape(_MISSING_PDF)}$")
+_JPG_NOT_FOUND = re.compile(f"^File not found: {re.escape(_MISSING_JPG)}$")
+
 
 class TestTelegramNotifier:
     """Tests for TelegramNotifier class."""
@@ -20,273 +41,427 @@ class TestTelegramNotifier:
         token = "test_token"
         notifier = TelegramNotifier(token)
         assert notifier.bot.token == token
+        assert notifier.bot.request.http_version == "2"
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager(
+        self, notifier: TelegramNotifier, mock_bot: Mock
+    ) -> None:
+        """Test that the notifier initializes and shuts down its bot."""
+        async with notifier as entered:
+            assert entered is notifier
+            mock_bot.initialize.assert_awaited_once()
+            mock_bot.shutdown.assert_not_awaited()
+
+        mock_bot.shutdown.assert_awaited_once()
 
     @pytest.mark.asyncio
-    @patch("telegram.Bot.send_message", new_callable=AsyncMock)
-    async def test_send_message_success(self, mock_send_message: AsyncMock) -> None:
+    async def test_close_shuts_down_request(
+        self, notifier: TelegramNotifier, mock_bot: Mock
+    ) -> None:
+        """Test that close releases connections of a never-initialized bot."""
+        await notifier.close()
+
+        mock_bot.shutdown.assert_awaited_once()
+        mock_bot.request.shutdown.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_send_message_success(
+        self, notifier: TelegramNotifier, mock_bot: Mock
+    ) -> None:
         """Test successful message sending."""
-        token = "test_token"
         chat_id = "123456789"
         message = "Test message"
 
-        notifier = TelegramNotifier(token)
-
         result = await notifier.send_message(chat_id, message)
 
         assert result is True
-        mock_send_message.assert_called_once_with(chat_id=chat_id, text=message)
+        mock_bot.send_message.assert_called_once_with(chat_id=chat_id, text=message)
 
     @pytest.mark.asyncio
-    @patch("telegram.Bot.send_message", new_callable=AsyncMock)
-    async def test_send_message_failure(self, mock_send_message: AsyncMock) -> None:
-        """Test message sending failure."""
-        token = "test_token"
-        chat_id = "123456789"
-        message = "Test message"
+    async def test_send_many_success(
+        self, notifier: TelegramNotifier, mock_bot: Mock
+    ) -> None:
+        """Test sending several messages concurrently."""
+        jobs = [("123456789", "First"), ("987654321", "Second")]
 
-        notifier = TelegramNotifier(token)
+        await notifier.send_many(jobs)
+
+        mock_bot.send_message.assert_any_await(chat_id="123456789", text="First")
+        mock_bot.send_message.assert_any_await(chat_id="987654321", text="Second")
+
+    @pytest.mark.asyncio
+    async def test_send_many_rate_limited(
+        self, notifier: TelegramNotifier, mock_bot: Mock
+    ) -> None:
+        """Test that no more than `rate` messages start within one second."""
+        jobs = [("123456789", f"Message {i}") for i in range(3)]
 
-        # Mock the bot's send_message method to raise an exception
-        error_msg = "Invalid chat_id"
-        mock_send_message.side_effect = TelegramError(error_msg)
+        task = asyncio.ensure_future(notifier.send_many(jobs, rate=2))
+        for _ in range(10):
+            await asyncio.sleep(0)
 
-        with pytest.raises(TelegramError, match=f"Failed to send message: {error_msg}"):
-            await notifier.send_message(chat_id, message)
+        assert mock_bot.send_message.await_count == 2
+        assert not task.done()
+
+        # Runs in loop time under --looptime, so the wait costs nothing
+        await asyncio.sleep(1.0)
+
+        await task
+        assert mock_bot.send_message.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_send_many_failure_cancels_pending(
+        self, notifier: TelegramNotifier, mock_bot: Mock
+    ) -> None:
+        """Test that one failed send cancels the rest before the error surfaces."""
+        never = asyncio.Event()
+
+        async def send_message(chat_id: str, text: str) -> None:
+            if text == "Bad":
+                raise TelegramError("Chat not found")
+            await never.wait()
+
+        mock_bot.send_message.side_effect = send_message
+        jobs = [("123456789", "First"), ("invalid", "Bad"), ("123456789", "Third")]
+        # rate=2 leaves the third job waiting for a slot when the second fails
+        with pytest.raises(TelegramError, match="Chat not found"):
+            await notifier.send_many(jobs, rate=2)
+
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        assert mock_bot.send_message.await_count == 2
 
     @pytest.mark.asyncio
-    @patch("telegram.Bot.send_document", new_callable=AsyncMock)
     async def test_send_document_success(
-        self, mock_send_document: AsyncMock, tmp_path
+        self, notifier: TelegramNotifier, mock_bot: Mock, dummy_pdf: str
     ) -> None:
         """Test successful document sending."""
-        token = "test_token"
         chat_id = "123456789"
 
-        # Create a temporary test file
-        test_file = tmp_path / "test_document.pdf"
-        test_file.write_text("Test document content")
-
-        notifier = TelegramNotifier(token)
-
-        result = await notifier.send_document(chat_id, str(test_file), "Test caption")
+        result = await notifier.send_document(chat_id, dummy_pdf, "Test caption")
 
         assert result is True
-        mock_send_document.assert_called_once()
-        args, kwargs = mock_send_document.call_args
+        mock_bot.send_document.assert_called_once()
+        args, kwargs = mock_bot.send_document.call_args
         assert kwargs["chat_id"] == chat_id
         assert kwargs["caption"] == "Test caption"
         assert kwargs["filename"] == "test_document.pdf"
+        assert kwargs["document"] == b"Test document content"
 
     @pytest.mark.asyncio
-    async def test_send_document_file_not_found(self) -> None:
+    async def test_send_document_file_not_found(
+        self, notifier: TelegramNotifier
+    ) -> None:
         """Test document sending with non-existent file."""
-        token = "test_token"
         chat_id = "123456789"
-        file_path = "/nonexistent/file.pdf"
 
-        notifier = TelegramNotifier(token)
-
-        with pytest.raises(FileNotFoundError, match=f"File not found: {file_path}"):
-            await notifier.send_document(chat_id, file_path)
+        with pytest.raises(FileNotFoundError, match=_PDF_NOT_FOUND):
+            await notifier.send_document(chat_id, _MISSING_PDF)
 
     @pytest.mark.asyncio
-    @patch("telegram.Bot.send_document", new_callable=AsyncMock)
     async def test_send_document_telegram_error(
-        self, mock_send_document: AsyncMock, tmp_path
+        self, notifier: TelegramNotifier, mock_bot: Mock, dummy_pdf: str
     ) -> None:
         """Test document sending with Telegram API error."""
-        token = "test_token"
         chat_id = "123456789"
 
-        test_file = tmp_path / "test_document.pdf"
-        test_file.write_text("Test document content")
-
-        notifier = TelegramNotifier(token)
         error_msg = "File too large"
-        mock_send_document.side_effect = TelegramError(error_msg)
+        mock_bot.send_document.side_effect = TelegramError(error_msg)
+
+        with pytest.raises(TelegramError, match=_FAIL_SEND_DOC) as exc_info:
+            await notifier.send_document(chat_id, dummy_pdf)
 
-        with pytest.raises(
-            TelegramError, match=f"Failed to send document: {error_msg}"
-        ):
-            await notifier.send_document(chat_id, str(test_file))
+        assert str(exc_info.value).endswith(error_msg)
 
     @pytest.mark.asyncio
-    @patch("telegram.Bot.send_photo", new_callable=AsyncMock)
     async def test_send_photo_success(
-        self, mock_send_photo: AsyncMock, tmp_path
+        self, notifier: TelegramNotifier, mock_bot: Mock, dummy_jpg: str
     ) -> None:
         """Test successful photo sending."""
-        token = "test_token"
         chat_id = "123456789"
 
-        # Create a temporary test image file
-        test_file = tmp_path / "test_image.jpg"
-        test_file.write_bytes(b"fake image data")
-
-        notifier = TelegramNotifier(token)
-
-        result = await notifier.send_photo(chat_id, str(test_file), "Test photo")
+        result = await notifier.send_photo(chat_id, dummy_jpg, "Test photo")
 
         assert result is True
-        mock_send_photo.assert_called_once()
-        args, kwargs = mock_send_photo.call_args
+        mock_bot.send_photo.assert_called_once()
+        args, kwargs = mock_bot.send_photo.call_args
         assert kwargs["chat_id"] == chat_id
         assert kwargs["caption"] == "Test photo"
+        assert kwargs["filename"] == "test_image.jpg"
+        assert kwargs["photo"] == b"fake image data"
 
     @pytest.mark.asyncio
-    async def test_send_photo_file_not_found(self) -> None:
+    async def test_send_photo_file_not_found(self, notifier: TelegramNotifier) -> None:
         """Test photo sending with non-existent file."""
-        token = "test_token"
         chat_id = "123456789"
-        file_path = "/nonexistent/image.jpg"
 
-        notifier = TelegramNotifier(token)
-
-        with pytest.raises(FileNotFoundError, match=f"File not found: {file_path}"):
-            await notifier.send_photo(chat_id, file_path)
+        with pytest.raises(FileNotFoundError, match=_JPG_NOT_FOUND):
+            await notifier.send_photo(chat_id, _MISSING_JPG)
 
     @pytest.mark.asyncio
-    @patch("telegram.Bot.send_photo", new_callable=AsyncMock)
     async def test_send_photo_telegram_error(
-        self, mock_send_photo: AsyncMock, tmp_path
+        self, notifier: TelegramNotifier, mock_bot: Mock, dummy_jpg: str
     ) -> None:
         """Test photo sending with Telegram API error."""
-        token = "test_token"
         chat_id = "123456789"
 
-        test_file = tmp_path / "test_image.jpg"
-        test_file.write_bytes(b"fake image data")
-
-        notifier = TelegramNotifier(token)
         error_msg = "Invalid image format"
-        mock_send_photo.side_effect = TelegramError(error_msg)
+        mock_bot.send_photo.side_effect = TelegramError(error_msg)
 
-        with pytest.raises(TelegramError, match=f"Failed to send photo: {error_msg}"):
-            await notifier.send_photo(chat_id, str(test_file))
+        with pytest.raises(TelegramError, match=_FAIL_SEND_PHOTO) as exc_info:
+            await notifier.send_photo(chat_id, dummy_jpg)
 
+        assert str(exc_info.value).endswith(error_msg)
 
-class TestSendNotification:
-    """Tests for send_notification function."""
 
-    @patch("telegram_notifier.notifier.TelegramNotifier")
-    def test_send_notification_success(self, mock_notifier_class: Mock) -> None:
-        """Test successful notification sending."""
-        token = "test_token"
-        chat_id = "123456789"
-        message = "Test message"
+_WRAPPERS = [
+    pytest.param(send_notification, "send_message", ("Test message",), id="message"),
+    pytest.param(
+        send_file, "send_document", ("report.pdf", "Test caption"), id="document"
+    ),
+    pytest.param(send_photo, "send_photo", ("image.jpg", "Test photo"), id="photo"),
+]
 
-        # Mock the notifier instance and its send_message method
-        mock_notifier = Mock()
-        mock_notifier.send_message = AsyncMock(return_value=True)
-        mock_notifier_class.return_value = mock_notifier
 
-        with patch("asyncio.run") as mock_run:
-            mock_run.return_value = True
-            result = send_notification(token, chat_id, message)
+class TestSyncWrappers:
+    """Tests for send_notification, send_file and send_photo."""
+
+    @pytest.mark.parametrize("wrapper,method_name,args", _WRAPPERS)
+    def test_wrapper_success(
+        self,
+        patched_notifier: Tuple[Mock, Mock],
+        wrapper: Callable[..., bool],
+        method_name: str,
+        args: Tuple[str, ...],
+    ) -> None:
+        """Test that each wrapper runs the matching notifier method."""
+        mock_notifier_class, mock_run = patched_notifier
+        method = AsyncMock(return_value=True)
+        setattr(mock_notifier_class.return_value, method_name, method)
+
+        result = wrapper("test_token", "123456789", *args)
 
         assert result is True
-        mock_notifier_class.assert_called_once_with(token)
+        mock_notifier_class.assert_called_once_with("test_token")
+        method.assert_awaited_once_with("123456789", *args)
         mock_run.assert_called_once()
 
-    @patch("telegram_notifier.notifier.TelegramNotifier")
-    def test_send_notification_failure(self, mock_notifier_class: Mock) -> None:
-        """Test notification sending failure."""
-        token = "test_token"
-        chat_id = "123456789"
-        message = "Test message"
+    @pytest.mark.parametrize(
+        "wrapper,method_name,args,error",
+        [
+            (
+                send_notification,
+                "send_message",
+                ("Test message",),
+                TelegramError("API Error"),
+            ),
+            (
+                send_file,
+                "send_document",
+                (_MISSING_PDF,),
+                FileNotFoundError("File not found"),
+            ),
+            (
+                send_photo,
+                "send_photo",
+                (_MISSING_JPG,),
+                FileNotFoundError("File not found"),
+            ),
+        ],
+        ids=["message", "document", "photo"],
+    )
+    def test_wrapper_failure(
+        self,
+        patched_notifier: Tuple[Mock, Mock],
+        wrapper: Callable[..., bool],
+        method_name: str,
+        args: Tuple[str, ...],
+        error: Exception,
+    ) -> None:
+        """Test that errors from the notifier propagate out of each wrapper."""
+        mock_notifier_class, _ = patched_notifier
+        method = AsyncMock(side_effect=error)
+        setattr(mock_notifier_class.return_value, method_name, method)
 
-        # Mock the notifier instance to raise an exception
-        mock_notifier = Mock()
-        mock_notifier.send_message = AsyncMock(side_effect=TelegramError("API Error"))
-        mock_notifier_class.return_value = mock_notifier
+        with pytest.raises(type(error)) as exc_info:
+            wrapper("test_token", "123456789", *args)
 
-        with patch("asyncio.run") as mock_run:
-            mock_run.side_effect = TelegramError("API Error")
-            with pytest.raises(TelegramError):
-                send_notification(token, chat_id, message)
+        assert exc_info.value is error
+        method.assert_awaited_once()
 
 
-class TestSendFile:
-    """Tests for send_file function."""
+_ASYNC_HELPERS = [
+    pytest.param(
+        send_notification_async, "send_message", ("Test message",), id="message"
+    ),
+    pytest.param(
+        send_file_async, "send_document", ("report.pdf", "Test caption"), id="document"
+    ),
+    pytest.param(
+        send_photo_async, "send_photo", ("image.jpg", "Test photo"), id="photo"
+    ),
+]
 
-    @patch("telegram_notifier.notifier.TelegramNotifier")
-    def test_send_file_success(self, mock_notifier_class: Mock, tmp_path) -> None:
-        """Test successful file sending."""
-        token = "test_token"
-        chat_id = "123456789"
 
-        test_file = tmp_path / "test.pdf"
-        test_file.write_text("test content")
+class TestAsyncHelpers:
+    """Tests for send_notification_async, send_file_async and send_photo_async."""
 
-        mock_notifier = Mock()
-        mock_notifier.send_document = AsyncMock(return_value=True)
-        mock_notifier_class.return_value = mock_notifier
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("helper,method_name,args", _ASYNC_HELPERS)
+    async def test_helper_success(
+        self,
+        mocker: MockerFixture,
+        helper: Callable[..., Awaitable[bool]],
+        method_name: str,
+        args: Tuple[str, ...],
+    ) -> None:
+        """Test that each helper sends once and closes its notifier."""
+        mock_notifier_class = mocker.patch(
+            "telegram_notifier.notifier.TelegramNotifier"
+        )
+        mock_notifier = mock_notifier_class.return_value
+        mock_notifier.close = AsyncMock()
+        method = AsyncMock(return_value=True)
+        setattr(mock_notifier, method_name, method)
 
-        with patch("asyncio.run") as mock_run:
-            mock_run.return_value = True
-            result = send_file(token, chat_id, str(test_file), "Test caption")
+        result = await helper("test_token", "123456789", *args)
 
         assert result is True
-        mock_notifier_class.assert_called_once_with(token)
-        mock_run.assert_called_once()
+        mock_notifier_class.assert_called_once_with("test_token")
+        method.assert_awaited_once_with("123456789", *args)
+        mock_notifier.close.assert_awaited_once()
+        assert _notifiers == {}
 
-    @patch("telegram_notifier.notifier.TelegramNotifier")
-    def test_send_file_failure(self, mock_notifier_class: Mock) -> None:
-        """Test file sending failure."""
-        token = "test_token"
-        chat_id = "123456789"
-        file_path = "/nonexistent/file.pdf"
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("helper,method_name,args", _ASYNC_HELPERS)
+    async def test_helper_failure_closes_notifier(
+        self,
+        mocker: MockerFixture,
+        helper: Callable[..., Awaitable[bool]],
+        method_name: str,
+        args: Tuple[str, ...],
+    ) -> None:
+        """Test that each helper closes its notifier when the send fails."""
+        mock_notifier = mocker.patch(
+            "telegram_notifier.notifier.TelegramNotifier"
+        ).return_value
+        mock_notifier.close = AsyncMock()
+        method = AsyncMock(side_effect=TelegramError("API Error"))
+        setattr(mock_notifier, method_name, method)
 
-        mock_notifier = Mock()
-        mock_notifier.send_document = AsyncMock(
-            side_effect=FileNotFoundError("File not found")
-        )
-        mock_notifier_class.return_value = mock_notifier
+        with pytest.raises(TelegramError, match="API Error"):
+            await helper("test_token", "123456789", *args)
 
-        with patch("asyncio.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError("File not found")
-            with pytest.raises(FileNotFoundError):
-                send_file(token, chat_id, file_path)
+        mock_notifier.close.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_helper_closes_real_client(self, mocker: MockerFixture) -> None:
+        """Test that a helper closes the HTTP client of its never-initialized bot."""
+        close = mocker.spy(TelegramNotifier, "close")
 
-class TestSendPhoto:
-    """Tests for send_photo function."""
+        with pytest.raises(FileNotFoundError, match=_PDF_NOT_FOUND):
+            await send_file_async("test_token", "123456789", _MISSING_PDF)
 
-    @patch("telegram_notifier.notifier.TelegramNotifier")
-    def test_send_photo_success(self, mock_notifier_class: Mock, tmp_path) -> None:
-        """Test successful photo sending."""
-        token = "test_token"
-        chat_id = "123456789"
+        notifier = close.call_args.args[0]
+        assert notifier.bot.request._client.is_closed
 
-        test_file = tmp_path / "test.jpg"
-        test_file.write_bytes(b"fake image data")
+
+class TestSendMany:
+    """Tests for send_many function and notifier reuse."""
+
+    def test_send_many_success(self, mocker: MockerFixture) -> None:
+        """Test sending several messages through one notifier."""
+        mock_notifier_class = mocker.patch(
+            "telegram_notifier.notifier.TelegramNotifier"
+        )
+        token = "test_token"
+        jobs = [("123456789", "First"), ("987654321", "Second")]
 
         mock_notifier = Mock()
-        mock_notifier.send_photo = AsyncMock(return_value=True)
+        mock_notifier.send_many = AsyncMock()
         mock_notifier_class.return_value = mock_notifier
 
-        with patch("asyncio.run") as mock_run:
-            mock_run.return_value = True
-            result = send_photo(token, chat_id, str(test_file), "Test photo")
+        send_many(token, jobs)
 
-        assert result is True
         mock_notifier_class.assert_called_once_with(token)
-        mock_run.assert_called_once()
+        mock_notifier.send_many.assert_awaited_once_with(jobs)
 
-    @patch("telegram_notifier.notifier.TelegramNotifier")
-    def test_send_photo_failure(self, mock_notifier_class: Mock) -> None:
-        """Test photo sending failure."""
-        token = "test_token"
-        chat_id = "123456789"
-        file_path = "/nonexistent/image.jpg"
+    def test_send_many_failure(self, mocker: MockerFixture) -> None:
+        """Test that a failing message surfaces from send_many."""
+        mock_notifier_class = mocker.patch(
+            "telegram_notifier.notifier.TelegramNotifier"
+        )
+        mock_notifier = Mock()
+        mock_notifier.send_many = AsyncMock(side_effect=TelegramError("API Error"))
+        mock_notifier_class.return_value = mock_notifier
+
+        with pytest.raises(TelegramError, match="API Error"):
+            send_many("test_token", [("123456789", "Test message")])
 
+    def test_wrappers_from_two_threads(self, mocker: MockerFixture) -> None:
+        """Test that threads calling the wrappers at once take turns on the loop."""
+        mock_notifier_class = mocker.patch(
+            "telegram_notifier.notifier.TelegramNotifier"
+        )
+        started = threading.Event()
+
+        async def slow_send(chat_id: str, message: str) -> bool:
+            started.set()
+            await asyncio.sleep(0.05)
+            return True
+
+        mock_notifier_class.return_value.send_message = slow_send
+        send_notification("test_token", "123456789", "Warm up")
+        started.clear()
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(send_notification, "test_token", "1", "First")
+            started.wait()
+            second = pool.submit(send_notification, "test_token", "2", "Second")
+
+            assert first.result() is True
+            assert second.result() is True
+        mock_notifier_class.assert_called_once_with("test_token")
+
+    def test_notifier_reused_across_calls(self, mocker: MockerFixture) -> None:
+        """Test that wrappers share one notifier per bot token."""
+        mock_notifier_class = mocker.patch(
+            "telegram_notifier.notifier.TelegramNotifier"
+        )
         mock_notifier = Mock()
-        mock_notifier.send_photo = AsyncMock(
-            side_effect=FileNotFoundError("File not found")
+        mock_notifier.send_message = AsyncMock(return_value=True)
+        mock_notifier_class.return_value = mock_notifier
+
+        assert send_notification("test_token", "123456789", "First") is True
+        assert send_notification("test_token", "123456789", "Second") is True
+        send_notification("other_token", "123456789", "Third")
+
+        assert mock_notifier_class.call_count == 2
+        mock_notifier_class.assert_any_call("test_token")
+        mock_notifier_class.assert_any_call("other_token")
+
+    def test_shutdown_closes_cached_notifiers(self) -> None:
+        """Test that exit-time shutdown closes the connections of cached bots."""
+        notifier = _get_notifier("test_token")
+        _run(asyncio.sleep(0))  # start the shared loop as a first send would
+
+        _shutdown()
+
+        # The bot was never initialized, so Bot.shutdown() alone is a no-op
+        assert notifier.bot.request._client.is_closed
+        assert _notifiers == {}
+
+    @pytest.mark.asyncio
+    async def test_sync_wrapper_in_running_loop(self, mocker: MockerFixture) -> None:
+        """Test that sync wrappers refuse to run inside an event loop."""
+        mock_notifier_class = mocker.patch(
+            "telegram_notifier.notifier.TelegramNotifier"
         )
+        mock_notifier = Mock()
+        mock_notifier.send_message = AsyncMock(return_value=True)
         mock_notifier_class.return_value = mock_notifier
 
-        with patch("asyncio.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError("File not found")
-            with pytest.raises(FileNotFoundError):
-                send_photo(token, chat_id, file_path)
+        with pytest.raises(RuntimeError, match="running event loop"):
+            send_notification("test_token", "123456789", "Test message")
+
+        mock_notifier.send_message.assert_not_awaited()
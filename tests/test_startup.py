@@ -0,0 +1,101 @@
+"""Startup regression tests guarding the lazy-import paths of the CLI."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import List
+
+import pytest
+
+from telegram_notifier import __version__
+
+# Runs the CLI in-process with stdout silenced, then reports sys.modules
+_PROBE = """
+import contextlib, io, json, sys
+from telegram_notifier.cli import cli
+
+sink = io.StringIO()
+with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+    try:
+        cli.main(sys.argv[1:], prog_name="telegram-notifier")
+    except SystemExit:
+        pass
+json.dump(sorted(sys.modules), sys.stdout)
+"""
+
+# Wall-clock timing is noisy on shared runners, so the budget check is opt-in;
+# the import probe above is what guards startup on every run
+HELP_BUDGET_SECONDS = 1.0
+
+
+def _clean_env() -> dict:
+    env = dict(os.environ)
+    env.pop("TELEGRAM_BOT_TOKEN", None)
+    env.pop("TELEGRAM_CHAT_ID", None)
+    return env
+
+
+def _loaded_modules(args: List[str]) -> List[str]:
+    output = subprocess.check_output(
+        [sys.executable, "-c", _PROBE, *args], text=True, env=_clean_env()
+    )
+    return json.loads(output)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--help"],
+        ["--version"],
+        ["send", "--help"],
+        ["send", "--message", "Test message"],
+        ["send-file-cmd", "--file", "/nonexistent/file.pdf"],
+    ],
+)
+def test_cli_does_not_import_telegram(args: List[str]) -> None:
+    """Test that help, version and validation failures skip the telegram stack."""
+    modules = _loaded_modules(args)
+
+    assert "telegram_notifier.cli" in modules
+    assert not [m for m in modules if m == "telegram" or m.startswith("telegram.")]
+    assert "httpx" not in modules
+    assert "telegram_notifier.notifier" not in modules
+    assert "importlib.metadata" not in modules
+
+
+def test_version_skips_click() -> None:
+    """Test that the entry point answers --version without importing click."""
+    probe = (
+        "import json, sys; from telegram_notifier.__main__ import main; "
+        "main(); print(json.dumps(sorted(sys.modules)))"
+    )
+    output = subprocess.check_output(
+        [sys.executable, "-c", probe, "--version"], text=True, env=_clean_env()
+    )
+    version_line, modules = output.splitlines()
+
+    assert version_line == f"telegram-notifier, version {__version__}"
+    assert "click" not in json.loads(modules)
+
+
+@pytest.mark.skipif(
+    not os.getenv("TELEGRAM_NOTIFIER_TIMING_TESTS"),
+    reason="set TELEGRAM_NOTIFIER_TIMING_TESTS=1 to run wall-clock checks",
+)
+def test_help_wall_time() -> None:
+    """Test that `--help` stays within the startup budget."""
+    command = [
+        sys.executable,
+        "-c",
+        "from telegram_notifier.cli import cli; cli(['--help'])",
+    ]
+
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, capture_output=True, env=_clean_env())
+        timings.append(time.perf_counter() - start)
+
+    assert min(timings) < HELP_BUDGET_SECONDS